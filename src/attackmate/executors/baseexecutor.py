@@ -1,3 +1,4 @@
+import os
 import logging
 import json
 from datetime import datetime
@@ -70,7 +71,7 @@ class BaseExecutor(ExitOnError, CmdVars, Looper, Background):
                     self.logger.warning(f'Skipping {command.cmd}')
                 return
         self.reset_run_count()
-        self.logger.debug(f"Template-Command: '{command.cmd}'")
+        self.logger.debug("Template-Command: '%s'", command.cmd)
         if command.background:
             self.exec_background(self.replace_variables(command))
         else:
@@ -78,7 +79,7 @@ class BaseExecutor(ExitOnError, CmdVars, Looper, Background):
 
     def log_command(self, command):
         """Log starting-status of the command"""
-        self.logger.info(f"Executing '{command}'")
+        self.logger.info("Executing '%s'", command)
 
     def log_metadata(self, logger: logging.Logger, command):
         """Log metadata of the command"""
@@ -86,6 +87,9 @@ class BaseExecutor(ExitOnError, CmdVars, Looper, Background):
             logger.info(f'Metadata: {json.dumps(command.metadata)}')
 
     def log_json(self, logger: logging.Logger, command, time):
+        # the json-logger is only enabled with --json
+        if not logger.isEnabledFor(logging.INFO):
+            return
         command_dict = self.make_command_serializable(command, time)
 
         try:
@@ -120,16 +124,38 @@ class BaseExecutor(ExitOnError, CmdVars, Looper, Background):
     def save_output(self, command: BaseCommand, result: Result):
         """Save output of command to a file. This method will
         ignore all exceptions and won't stop the programm
-        on error.
+        on error. If the command is looped, only the last
+        output is saved.
         """
         if command.save:
             try:
-                with open(command.save, 'w') as outfile:
-                    outfile.write(result.stdout)
+                data = memoryview(result.stdout.encode())
+                # same flags and mode as open(path, 'w'), but without the
+                # buffered text-layer and its additional syscalls
+                fd = os.open(command.save, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    while data:
+                        data = data[os.write(fd, data):]
+                finally:
+                    os.close(fd)
             except Exception as e:
                 self.logger.warning(f'Unable to write output to file {command.save}: {e}')
 
     def exec(self, command: BaseCommand):
+        result = None
+        try:
+            while True:
+                result = self._execute_once(command)
+                self.check_result(command, result)
+                if not self.loop_check(command, result):
+                    break
+        finally:
+            # only the output of the last run is saved, also if
+            # one of the checks exits the programm
+            if result is not None:
+                self.save_output(command, result)
+
+    def _execute_once(self, command: BaseCommand) -> Result:
         try:
             self.log_command(command)
             self.log_metadata(self.logger, command)
@@ -137,18 +163,17 @@ class BaseExecutor(ExitOnError, CmdVars, Looper, Background):
             result = self._exec_cmd(command)
         except ExecException as error:
             result = Result(error, 1)
+        if not isinstance(result.stdout, str):
+            result.stdout = '' if result.stdout is None else str(result.stdout)
         self.log_json(self.json_logger, command, time_of_execution)
-        self.save_output(command, result)
+        return result
+
+    def check_result(self, command: BaseCommand, result: Result):
         if not command.background:
             self.exit_on_error(command, result)
             self.set_result_vars(result)
-            self.output.info(f'Command: {command.cmd}\n{result.stdout}')
+            self.output.info('Command: %s\n%s', command.cmd, result.stdout)
             self.error_if_or_not(command, result)
-        self.loop_if(command, result)
-        self.loop_if_not(command, result)
-
-    def _loop_exec(self, command: BaseCommand):
-        self.exec(command)
 
     def _exec_cmd(self, command: Any) -> Result:
         return Result(None, None)
@@ -1,11 +1,38 @@
-import copy
-
+from types import UnionType
+from typing import Any, Literal, Union, get_args, get_origin
 from attackmate.result import Result
 from attackmate.schemas.base import BaseCommand, StringNumber
 from attackmate.variablestore import VariableStore
 from attackmate.execexception import ExecException
 
 
+# Names of the members per command-class that might be used as templates.
+# BaseCommand.list_template_vars() depends on the values of a command, so
+# only the candidates are cached and the values are checked on every use.
+_TVAR_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+def _may_be_template(annotation: Any) -> bool:
+    if annotation in (bool, int, float, type(None)):
+        return False
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return any(isinstance(arg, str) for arg in get_args(annotation))
+    if origin in (Union, UnionType):
+        return any(_may_be_template(arg) for arg in get_args(annotation))
+    return True
+
+
+def template_members(command: BaseCommand) -> tuple[str, ...]:
+    cls = type(command)
+    members = _TVAR_CACHE.get(cls)
+    if members is None:
+        members = tuple(k for k, field in cls.model_fields.items()
+                        if k != 'type' and _may_be_template(field.annotation))
+        _TVAR_CACHE[cls] = members
+    return members
+
+
 class CmdVars:
     def __init__(self, variablestore: VariableStore):
         self.varstore = variablestore
@@ -16,11 +43,42 @@ class CmdVars:
             self.varstore.set_variable('RESULT_STDOUT', result.stdout)
             self.varstore.set_variable('RESULT_RETURNCODE', str(result.returncode))
 
+    @staticmethod
+    def needs_substitution(command: BaseCommand) -> bool:
+        """ Check if any template-variable of the BaseCommand contains a "$"
+
+        Only strings that contain a "$" can reference a variable
+        (or an escaped "$$"). If no member contains one, the
+        command can be used as it is.
+
+        Parameters
+        ----------
+        command : BaseCommand
+            BaseCommand that should be checked
+
+        Returns
+        -------
+        bool
+            True if at least one member must be substituted
+        """
+        for member in template_members(command):
+            cmd_member = command.__dict__.get(member)
+            if isinstance(cmd_member, str):
+                if '$' in cmd_member:
+                    return True
+            elif isinstance(cmd_member, (dict, list)):
+                for v in (cmd_member.values() if isinstance(cmd_member, dict) else cmd_member):
+                    if isinstance(v, str) and '$' in v:
+                        return True
+        return False
+
     def replace_variables(self, command: BaseCommand) -> BaseCommand:
         """ Replace variables using the VariableStore
 
         Replace all template-variables of the BaseCommand and return
         a new BaseCommand with all variables replaced with their values.
+        If no member contains a variable, the BaseCommand itself is
+        returned and must therefore not be modified by the caller.
 
         Parameters
         ----------
@@ -32,27 +90,31 @@ class CmdVars:
         BaseCommand
             BaseCommand with replaced variables
         """
-        template_cmd = copy.deepcopy(command)
-        for member in command.list_template_vars():
-            cmd_member = getattr(command, member)
+        if not self.needs_substitution(command):
+            return command
+        # members that are substituted are replaced by new objects
+        # below, so a shallow copy of the command is sufficient
+        template_cmd = command.model_copy()
+        # the members were validated when the command was created and the
+        # substituted values have the same types. Therefore the __dict__ of
+        # the models is used directly and pydantic's __setattr__ is bypassed.
+        values = command.__dict__
+        template_values = template_cmd.__dict__
+        for member in template_members(command):
+            cmd_member = values.get(member)
             if isinstance(cmd_member, str):
-                replaced_str = self.varstore.substitute(cmd_member)
-                setattr(template_cmd, member, replaced_str)
+                template_values[member] = self.varstore.substitute(cmd_member)
             elif isinstance(cmd_member, dict):
                 # copy the dict to avoid referencing the original dict
-                new_cmd_member = copy.deepcopy(cmd_member)
+                new_cmd_member = {k: (v.copy() if isinstance(v, (list, dict)) else v)
+                                  for k, v in cmd_member.items()}
                 for k, v in new_cmd_member.items():
                     if isinstance(v, str):
                         new_cmd_member[k] = self.varstore.substitute(v)
-                setattr(template_cmd, member, new_cmd_member)
+                template_values[member] = new_cmd_member
             elif isinstance(cmd_member, list):
-                # copy the dict to avoid referencing the original list
-                new_list = [i for i in cmd_member]
-                for v in new_list:
-                    if isinstance(v, str):
-                        index = new_list.index(v)
-                        new_list[index] = self.varstore.substitute(v)
-                setattr(template_cmd, member, new_list)
+                # copy the list to avoid referencing the original list
+                template_values[member] = [self.varstore.substitute(v) for v in cmd_member]
         return template_cmd
 
     @staticmethod
@@ -63,9 +125,9 @@ class CmdVars:
         if isinstance(value, int):
             return value
 
-        if value.isnumeric():
+        try:
             return int(value)
-        else:
+        except ValueError:
             raise ExecException(f'Variable {variablename} has not a numeric value: {value}')
 
     @staticmethod
@@ -1,5 +1,5 @@
-import re
 import logging
+from attackmate.patterncache import get_matcher
 from attackmate.result import Result
 from attackmate.schemas.base import BaseCommand
 
@@ -20,16 +20,16 @@ class ExitOnError:
 
     def error_if(self, command: BaseCommand, result: Result):
         if command.error_if is not None:
-            m = re.search(command.error_if, result.stdout, re.MULTILINE)
+            m = get_matcher(command.error_if).search(result.stdout)
             if m is not None:
                 self.logger.error(
-                        f'Exitting because error_if matches: {m.group(0)}'
+                        f'Exitting because error_if matches: {m}'
                         )
                 exit(1)
 
     def error_if_not(self, command: BaseCommand, result: Result):
         if command.error_if_not is not None:
-            m = re.search(command.error_if_not, result.stdout, re.MULTILINE)
+            m = get_matcher(command.error_if_not).search(result.stdout)
             if m is None:
                 self.logger.error(
                         'Exitting because error_if_not does not match'
@@ -1,7 +1,7 @@
-import re
 import time
 import logging
 from attackmate.executors.features.cmdvars import CmdVars
+from attackmate.patterncache import get_matcher
 from attackmate.result import Result
 from attackmate.schemas.base import BaseCommand
 from attackmate.schemas.config import CommandConfig
@@ -13,43 +13,42 @@ class Looper:
         self.cmdconfig = cmdconfig
         self.reset_run_count()
 
-    def _loop_exec(self, command: BaseCommand):
-        if hasattr(command, 'type'):
-            err_str = f'loop_exec for command {command.type} is not implemented!'
-        else:
-            err_str = 'loop_exec for command is not implemented!'
-        self.logger.error(err_str)
-        exit(1)
-
     def reset_run_count(self):
         self.run_count = 1
 
-    def loop_if(self, command: BaseCommand, result: Result):
+    def loop_check(self, command: BaseCommand, result: Result) -> bool:
+        """Check if the command must be executed again
+
+        Returns True if loop_if matches or loop_if_not does not
+        match. In this case the run_count is increased and the
+        loop_sleep is awaited already.
+        """
+        return self.loop_if(command, result) or self.loop_if_not(command, result)
+
+    def prepare_loop(self, command: BaseCommand) -> bool:
+        if self.run_count < CmdVars.variable_to_int('loop_count', command.loop_count):
+            self.run_count = self.run_count + 1
+            time.sleep(self.cmdconfig.loop_sleep)
+            return True
+        self.logger.error('Exiting because loop_count exceeded')
+        exit(1)
+
+    def loop_if(self, command: BaseCommand, result: Result) -> bool:
         if command.loop_if is not None:
-            m = re.search(command.loop_if, result.stdout, re.MULTILINE)
+            m = get_matcher(command.loop_if).search(result.stdout)
             if m is not None:
-                self.logger.warning(f'Re-run command because loop_if matches: {m.group(0)}')
-                if self.run_count < CmdVars.variable_to_int('loop_count', command.loop_count):
-                    self.run_count = self.run_count + 1
-                    time.sleep(self.cmdconfig.loop_sleep)
-                    self._loop_exec(command)
-                else:
-                    self.logger.error('Exiting because loop_count exceeded')
-                    exit(1)
+                self.logger.warning(f'Re-run command because loop_if matches: {m}')
+                return self.prepare_loop(command)
             else:
                 self.logger.debug('loop_if does not match')
+        return False
 
-    def loop_if_not(self, command: BaseCommand, result: Result):
+    def loop_if_not(self, command: BaseCommand, result: Result) -> bool:
         if command.loop_if_not is not None:
-            m = re.search(command.loop_if_not, result.stdout, re.MULTILINE)
+            m = get_matcher(command.loop_if_not).search(result.stdout)
             if m is None:
                 self.logger.warning('Re-run command because loop_if_not does not match')
-                if self.run_count < CmdVars.variable_to_int('loop_count', command.loop_count):
-                    self.run_count = self.run_count + 1
-                    time.sleep(self.cmdconfig.loop_sleep)
-                    self._loop_exec(command)
-                else:
-                    self.logger.error('Exitting because loop_count exceeded')
-                    exit(1)
+                return self.prepare_loop(command)
             else:
                 self.logger.debug('loop_if_not does not match')
+        return False
@@ -21,9 +21,8 @@ class HttpClientExecutor(BaseExecutor):
     def generate_headers(self, command: HttpClientCommand) -> dict[str, str]:
         if not command.headers:
             return {'User-Agent': command.useragent}
-        if command.headers:
-            if 'User-Agent' not in command.headers.keys():
-                command.headers['User-Agent'] = command.useragent
+        if 'User-Agent' not in command.headers.keys():
+            return command.headers | {'User-Agent': command.useragent}
         return command.headers
 
     def output_headers(self, headers: httpx.Headers) -> str:
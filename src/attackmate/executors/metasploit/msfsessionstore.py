@@ -1,4 +1,5 @@
 import time
+from queue import Empty
 import logging
 from typing import Dict, Optional
 from multiprocessing import JoinableQueue
@@ -13,22 +14,37 @@ class MsfSessionStore:
         self.varstore = varstore
         self.queue: Optional[JoinableQueue] = None
         self.get_session_wait_time = 5
+        # msfsessions.list is polled via RPC. There is nothing
+        # to wait on, so sleep between the polls instead of spinning
+        self.session_poll_time = 0.1
 
     def add_session(self, name: str, uuid: str) -> None:
         self.logger.debug(f'Set MSF-Session: {name} = {uuid}')
         self.sessions[name] = uuid
 
+    def drain_queue(self) -> bool:
+        """Add all sessions from the queue without blocking
+
+        Returns True if at least one session was taken from the queue.
+        """
+        drained = False
+        try:
+            while True:
+                name, uuid, session_id = self.queue.get_nowait()  # type: ignore
+                self.logger.debug(f'Session from Queue: {name} = {uuid}')
+                self.add_session(name, uuid)
+                self.logger.debug(f'Set LAST_MSF_SESSION to {session_id}')
+                self.varstore.set_variable('LAST_MSF_SESSION', str(session_id))
+                self.queue.task_done()  # type: ignore
+                drained = True
+        except Empty:
+            pass
+        return drained
+
     def get_session_by_name(self, name: str, msfsessions, block: bool = True) -> str:
         while True:
-            if self.queue:
-                while not self.queue.empty():
-                    item = self.queue.get()
-                    self.logger.debug(f'Session from Queue: {item[0]} = {item[1]}')
-                    self.add_session(item[0], item[1])
-                    self.logger.debug(f'Set LAST_MSF_SESSION to {item[2]}')
-                    self.varstore.set_variable('LAST_MSF_SESSION', item[2])
-                    self.queue.task_done()
-                    time.sleep(self.get_session_wait_time)
+            if self.queue and self.drain_queue():
+                time.sleep(self.get_session_wait_time)
             for k, v in msfsessions.list.items():
                 if name in self.sessions:
                     if v['exploit_uuid'] == self.sessions[name]:
@@ -58,20 +74,23 @@ class MsfSessionStore:
     def wait_for_session(self, name: str, uuid: str, msfsessions, queue: Optional[JoinableQueue] = None):
         self.logger.debug(f'Sessions: {msfsessions.list}')
         while True:
-            if len(list(msfsessions.list.keys())) > 0:
-                for session_id, v in msfsessions.list.items():
-                    if v['exploit_uuid'] == uuid:
-                        self.add_or_queue_session(name, uuid, queue, session_id)
-                        return
+            for session_id, v in msfsessions.list.items():
+                if v['exploit_uuid'] == uuid:
+                    self.add_or_queue_session(name, uuid, queue, session_id)
+                    return
+            time.sleep(self.session_poll_time)
 
     def wait_for_increased_session(self, name: str, uuid: str, msfsessions,
                                    queue: Optional[JoinableQueue] = None):
-        stored_list_len = len(list(msfsessions.list.keys()))
-        sessions = list(msfsessions.list.keys())
+        # every access of msfsessions.list is an RPC-call
+        sessions = set(msfsessions.list.keys())
+        stored_list_len = len(sessions)
         while True:
-            if len(list(msfsessions.list.keys())) > stored_list_len:
-                for session_id, v in msfsessions.list.items():
+            current = msfsessions.list
+            if len(current) > stored_list_len:
+                for session_id, v in current.items():
                     if session_id not in sessions:
                         self.add_or_queue_session(name, v['exploit_uuid'], queue, session_id)
-                        self.logger.debug(f'Sessions: {msfsessions.list}')
+                        self.logger.debug(f'Sessions: {current}')
                         return
+            time.sleep(self.session_poll_time)
@@ -0,0 +1,65 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+# without these characters a pattern only matches itself
+REGEX_SPECIAL_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+class Matcher:
+    """Search a pattern in a text
+
+    Patterns without any special characters are searched
+    with the in-operator and not with the regex-engine.
+    All other patterns are compiled with re.MULTILINE.
+    Whether the pattern matches an empty text is known
+    in advance, so empty texts are never searched.
+    """
+
+    __slots__ = ('pattern', 'is_literal', 'regex', 'empty_match')
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.is_literal = REGEX_SPECIAL_CHARS.isdisjoint(pattern)
+        self.regex = None if self.is_literal else re.compile(pattern, re.MULTILINE)
+        self.empty_match = self._search('')
+
+    def search(self, text: str) -> Optional[str]:
+        """Search the pattern in the text
+
+        Returns
+        -------
+        Optional[str]
+            The matching string or None if the pattern does not match
+        """
+        if not text:
+            return self.empty_match
+        return self._search(text)
+
+    def _search(self, text: str) -> Optional[str]:
+        if self.is_literal:
+            return self.pattern if self.pattern in text else None
+        m = self.regex.search(text)  # type: ignore
+        return None if m is None else m.group(0)
+
+
+@lru_cache(maxsize=512)
+def get_matcher(pattern: str) -> Matcher:
+    """Get a cached Matcher for the pattern
+
+    error_if, error_if_not, loop_if and loop_if_not are evaluated
+    on every execution (and on every loop-iteration) of a command.
+    Compiling the pattern once and keeping it in a bounded cache
+    avoids recompiling it over and over again.
+
+    Parameters
+    ----------
+    pattern : str
+        The regular expression to search for
+
+    Returns
+    -------
+    Matcher
+        The Matcher for the pattern
+    """
+    return Matcher(pattern)
@@ -5,6 +5,8 @@ class Result:
     by the Executors. It stores the standard-output
     and the returncode.
     """
+    __slots__ = ('stdout', 'returncode')
+
     stdout: str
     returncode: int
 
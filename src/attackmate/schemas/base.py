@@ -2,6 +2,7 @@ from typing import Annotated, List, Optional, Dict
 from dataclasses import field
 from pydantic import AfterValidator, BeforeValidator, BaseModel, ValidationInfo
 import re
+from attackmate.patterncache import get_matcher
 
 # https://stackoverflow.com/questions/71539448/using-different-pydantic-models-depending-on-the-value-of-fields
 VAR_PATTERN = r'^\$[$a-zA-Z0-9_]+$|^[0-9]+$'
@@ -26,6 +27,20 @@ StringNumber = Annotated[
 StrInt = Annotated[Optional[str | int], BeforeValidator(transform_int_to_str)]
 
 
+def check_regex(value: Optional[str], info: ValidationInfo) -> Optional[str]:
+    # compiling the pattern here reports invalid regular expressions while
+    # parsing the playbook and fills the cache that is used by the executors
+    if value is not None:
+        try:
+            get_matcher(value)
+        except re.error as e:
+            raise ValueError(f'{info.field_name} is not a valid regular expression: {e}')
+    return value
+
+
+RegexPattern = Annotated[Optional[str], AfterValidator(check_regex)]
+
+
 class BaseCommand(BaseModel):
     def list_template_vars(self) -> List[str]:
         """Get a list of all variables that can be used as templates
@@ -48,10 +63,10 @@ class BaseCommand(BaseModel):
         return template_vars
 
     only_if: Optional[str] = None
-    error_if: Optional[str] = None
-    error_if_not: Optional[str] = None
-    loop_if: Optional[str] = None
-    loop_if_not: Optional[str] = None
+    error_if: RegexPattern = None
+    error_if_not: RegexPattern = None
+    loop_if: RegexPattern = None
+    loop_if_not: RegexPattern = None
     loop_count: StringNumber = '3'
     exit_on_error: bool = True
     save: Optional[str] = None
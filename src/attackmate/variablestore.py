@@ -35,6 +35,7 @@ class VariableStore:
     def clear(self):
         self.lists: dict[str, list[str]] = {}
         self.variables: dict[str, str] = {}
+        self._mapping: Optional[dict[str, str]] = None
 
     @classmethod
     def is_list(cls, variable: str) -> bool:
@@ -89,18 +90,31 @@ class VariableStore:
         else:
             raise VariableNotFound
 
+    def get_mapping(self) -> dict[str, str]:
+        """Get all variables and indexed list-variables in one dict
+
+        The mapping is built once and reused for every substitution
+        until the next call of set_variable() or clear().
+        """
+        if self._mapping is None:
+            self._mapping = self.variables | self.get_lists_variables()
+        return self._mapping
+
     def substitute_str(self, template_str: str, blank: bool = False) -> str:
+        if '$' not in template_str:
+            return template_str
         temp = ListTemplate(template_str)
         if blank:
             try:
-                return temp.substitute(self.variables | self.get_lists_variables())
+                return temp.substitute(self.get_mapping())
             except KeyError:
                 return ''
         else:
-            return temp.safe_substitute(self.variables | self.get_lists_variables())
+            return temp.safe_substitute(self.get_mapping())
 
     def set_variable(self, variable: str, value: str | list[str]):
         if isinstance(variable, str):
+            self._mapping = None
             varname = self.remove_sign(variable)
             if isinstance(value, str):
                 if self.is_list(varname):
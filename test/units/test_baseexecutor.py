@@ -1,10 +1,12 @@
 import pytest
+from pydantic import ValidationError
 from attackmate.executors.baseexecutor import BaseExecutor
 from attackmate.execexception import ExecException
 from attackmate.result import Result
 from attackmate.variablestore import VariableStore
 from attackmate.processmanager import ProcessManager
 from attackmate.schemas.base import BaseCommand
+from attackmate.schemas.config import CommandConfig
 from attackmate.schemas.regex import RegExCommand
 from attackmate.schemas.sliver import SliverSessionEXECCommand
 
@@ -22,6 +24,14 @@ class DummyExecutor(BaseExecutor):
         return Result(command.return_str, command.return_val)
 
 
+class CountingExecutor(DummyExecutor):
+    calls = 0
+
+    def _exec_cmd(self, command: DummyCommand):
+        self.calls += 1
+        return Result(f'call {self.calls}', 0)
+
+
 class TestBaseExecutor:
     def test_replace_variables_in_strings(self):
         varstore = VariableStore()
@@ -78,12 +88,28 @@ class TestBaseExecutor:
         assert sl.args[0] == 'woo $wonder'
         assert sl.args[1] == 'hoo $foo'
 
+    def test_replace_variables_without_variables(self):
+        varstore = VariableStore()
+        varstore.set_variable('foo', 'bar')
+        be = BaseExecutor(ProcessManager(), varstore)
+        bc = BaseCommand(cmd='hello world', loop_if_not='world')
+        assert be.replace_variables(bc) is bc
+        sl = SliverSessionEXECCommand(type='sliver-session', cmd='execute',
+                                      exe='hello', session='world',
+                                      args=['woo', 'hoo $foo'])
+        replaced = be.replace_variables(sl)
+        assert replaced is not sl
+        assert replaced.args[1] == 'hoo bar'
+
     def test_variable_to_int(self):
         varstore = VariableStore()
         be = BaseExecutor(ProcessManager(), varstore)
         assert be.variable_to_int('foo', '1') == 1
+        assert be.variable_to_int('foo', '-5') == -5
         with pytest.raises(ExecException):
             be.variable_to_int('foo', '$var')
+        with pytest.raises(ExecException):
+            be.variable_to_int('foo', '²')
 
     def test_dummy__exec(self):
         varstore = VariableStore()
@@ -141,3 +167,65 @@ class TestBaseExecutor:
             executor.exec(dc)
         except SystemExit:
             pytest.fail('Unexpected Exit')
+
+    def test_loop_is_iterative(self):
+        varstore = VariableStore()
+        executor = CountingExecutor(ProcessManager(), varstore, CommandConfig(loop_sleep=0))
+        dc = DummyCommand(cmd='dummy', loop_if_not='call 4', loop_count='10')
+        executor.exec(dc)
+        assert executor.calls == 4
+        assert executor.run_count == 4
+        assert varstore.get_variable('RESULT_STDOUT') == 'call 4'
+        executor = CountingExecutor(ProcessManager(), varstore, CommandConfig(loop_sleep=0))
+        dc = DummyCommand(cmd='dummy', loop_if='call', loop_count='5')
+        with pytest.raises(SystemExit):
+            executor.exec(dc)
+        assert executor.calls == 5
+
+    def test_save_output(self, tmp_path):
+        varstore = VariableStore()
+        executor = DummyExecutor(ProcessManager(), varstore)
+        outfile = tmp_path / 'output.txt'
+        dc = DummyCommand(cmd='dummy', save=str(outfile))
+        executor.exec(dc)
+        assert outfile.read_text() == dc.return_str
+        dc = DummyCommand(cmd='dummy', save=str(tmp_path / 'missing' / 'output.txt'))
+        executor.exec(dc)
+
+    def test_empty_output(self):
+        varstore = VariableStore()
+        executor = DummyExecutor(ProcessManager(), varstore)
+        dc = DummyCommand(cmd='dummy', return_str='', error_if='something')
+        executor.exec(dc)
+        dc = DummyCommand(cmd='dummy', return_str='', error_if='^$')
+        with pytest.raises(SystemExit):
+            executor.exec(dc)
+        dc = DummyCommand(cmd='dummy', return_str='', error_if_not='.*')
+        executor.exec(dc)
+        dc = DummyCommand(cmd='dummy', return_except=True, exit_on_error=False, error_if='Fail')
+        with pytest.raises(SystemExit):
+            executor.exec(dc)
+        dc = DummyCommand(cmd='dummy', return_except=True, exit_on_error=False)
+        executor.exec(dc)
+        assert varstore.get_variable('RESULT_STDOUT') == 'Failed'
+
+    def test_save_output_of_last_loop(self, tmp_path):
+        varstore = VariableStore()
+        executor = CountingExecutor(ProcessManager(), varstore, CommandConfig(loop_sleep=0))
+        outfile = tmp_path / 'output.txt'
+        dc = DummyCommand(cmd='dummy', loop_if_not='call 3', save=str(outfile))
+        executor.exec(dc)
+        assert outfile.read_text() == 'call 3'
+        executor = CountingExecutor(ProcessManager(), varstore, CommandConfig(loop_sleep=0))
+        dc = DummyCommand(cmd='dummy', error_if='call 1', save=str(outfile))
+        with pytest.raises(SystemExit):
+            executor.exec(dc)
+        assert outfile.read_text() == 'call 1'
+
+    def test_invalid_regex(self):
+        with pytest.raises(ValidationError, match='error_if is not a valid regular expression'):
+            BaseCommand(cmd='dummy', error_if='(unbalanced')
+        with pytest.raises(ValidationError, match='loop_if_not is not a valid regular expression'):
+            BaseCommand(cmd='dummy', loop_if_not='[a-')
+        bc = BaseCommand(cmd='dummy', loop_if='^$foo (done)')
+        assert bc.loop_if == '^$foo (done)'
@@ -103,6 +103,18 @@ class TestVariableStore(unittest.TestCase):
         assert all_list_vars['second[1]'] == 'two'
         assert all_list_vars['second[2]'] == 'three'
 
+    def test_substitute_after_set_variable(self) -> None:
+        var_store = VariableStore()
+        var_store.set_variable('foo', 'bar')
+        var_store.set_variable('first', ['one', 'two'])
+        assert var_store.substitute('$foo $first[1]') == 'bar two'
+        var_store.set_variable('foo', 'baz')
+        var_store.set_variable('first[1]', 'three')
+        assert var_store.substitute('$foo $first[1]') == 'baz three'
+        assert var_store.substitute('no variables', True) == 'no variables'
+        var_store.clear()
+        assert var_store.substitute('$foo') == '$foo'
+
     def test_get_prefixed_env_vars(self) -> None:
         var_store: VariableStore = VariableStore()
         env_vars = {